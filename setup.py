@@ -30,4 +30,5 @@ setup(
     # and nowhere else
     package_dir={'': 'src'},
     install_requires=['numpy >= 1.13.0', 'defusedxml >= 0.6.0', 'Pillow >= 5.0.0'],
+    extras_require={'lxml': ['lxml']},
 )
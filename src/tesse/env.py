@@ -44,30 +44,32 @@ class Env(object):
         self.step_port = step_port
 
     def get_port(self, msg):
-        if msg.get_interface() == Interface.POSITION:
+        interface = msg.get_interface()
+        if interface == Interface.POSITION:
             port = self.position_port
-        elif msg.get_interface() == Interface.METADATA:
+        elif interface == Interface.METADATA:
             port = self.metadata_port
-        elif msg.get_interface() == Interface.IMAGE:
+        elif interface == Interface.IMAGE:
             port = self.image_port
-        elif msg.get_interface() == Interface.STEP:
+        elif interface == Interface.STEP:
             port = self.step_port
         else:
-            raise ValueError("Invalid message interface: {}".format(msg.get_interface()))
+            raise ValueError("Invalid message interface: {}".format(interface))
 
         return port
 
 
     def send(self, msg):
-        if self.get_port(msg) == self.step_port:
+        port = self.get_port(msg)
+        if port == self.step_port:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)  # tcp socket
-            s.connect((self.simulation_ip, self.get_port(msg)))
+            s.connect((self.simulation_ip, port))
             s.send(msg.encode())
             s.recv(3)
             s.close()
         else:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)  # udp socket
-            s.sendto(msg.encode(), (self.simulation_ip, self.get_port(msg)))
+            s.sendto(msg.encode(), (self.simulation_ip, port))
             s.close()
 
 
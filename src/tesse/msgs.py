@@ -27,6 +27,15 @@ from abc import ABCMeta
 from enum import Enum
 
 
+# image header: 4 unused bytes, payload length, width, height, camera id, 4 character type, 8 unused bytes
+_IMAGE_HEADER = struct.Struct("4xIIII4s8x")
+
+# channel weights used to decode RGBA encoded 'xFLT' and 'xINT' images
+# the 'xFLT' weights have the final 1/255 normalization folded in
+_FLOAT_DECODING = 1.0 / 255.0 ** np.arange(4) / 255.0
+_INT_DECODING = np.array([1, 255, 65025])  # np.array([1, 255, 255**2])
+
+
 class Camera(Enum):
     ALL = -1  # ?
     RGB_LEFT = 0
@@ -292,13 +301,9 @@ class DataResponse(object):
 
     def _decode_images(self, images=None):
         while len(images) > 0:
-            img_payload_length = struct.unpack("I", images[4:8])[0]  # the first 4 is an unused header
-            img_width = struct.unpack("I", images[8:12])[0]
-            img_height = struct.unpack("I", images[12:16])[0]
-            cam_id = struct.unpack("I", images[16:20])[0]
-            # img_type = bytes(images[20:24]).decode("utf-8")  # python 3
-            img_type = images[20:24].tobytes().decode("utf-8")  # python 2/3
-            images = images[32:]  # everything except the header
+            img_payload_length, img_width, img_height, cam_id, img_type = _IMAGE_HEADER.unpack_from(images)
+            img_type = img_type.decode("utf-8")
+            images = images[_IMAGE_HEADER.size:]  # everything except the header
 
             # img = np.frombuffer(images[:img_payload_length], dtype=np.uint8)  # python 3
             img = np.frombuffer(images[:img_payload_length].tobytes(), dtype=np.uint8)  # python 2/3
@@ -310,12 +315,11 @@ class DataResponse(object):
 
             if img_type == 'xFLT':
                 # decode an RGBA color image into a float32 image
-                img = np.dot(img, np.array([1.00000000e+00, 3.92156863e-03, 1.53787005e-05, 6.03086294e-08])).astype('float32')  # np.asarray((1.0, 1.0/255.0, 1.0/(255.0*255.0), 1.0/(255.0*255.0*255.0)))
-                img /= 255.0
+                img = np.dot(img, _FLOAT_DECODING).astype('float32')
 
             if img_type == 'xINT':
                 # decode RGBA image into a unsigned int image. Background is given the maximum value by default (16646655).
-                img = np.dot(img, np.array([1, 255, 65025])).astype(np.uint32)  # np.array([1, 255, 255**2])
+                img = np.dot(img, _INT_DECODING).astype(np.uint32)
 
             images = images[img_payload_length:]
 
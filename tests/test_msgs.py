@@ -0,0 +1,67 @@
+###################################################################################################
+# DISTRIBUTION STATEMENT A. Approved for public release. Distribution is unlimited.
+#
+# This material is based upon work supported by the Under Secretary of Defense for Research and
+# Engineering under Air Force Contract No. FA8702-15-D-0001. Any opinions, findings, conclusions
+# or recommendations expressed in this material are those of the author(s) and do not necessarily
+# reflect the views of the Under Secretary of Defense for Research and Engineering.
+#
+# (c) 2020 Massachusetts Institute of Technology.
+#
+# MIT Proprietary, Subject to FAR52.227-11 Patent Rights - Ownership by the contractor (May 2014)
+#
+# The software/firmware is provided to you on an As-Is basis
+#
+# Delivered to the U.S. Government with Unlimited Rights, as defined in DFARS Part 252.227-7013
+# or 7014 (Feb 2014). Notwithstanding any copyright notice, U.S. Government rights in this work
+# are defined by DFARS 252.227-7013 or DFARS 252.227-7014 as detailed above. Use of this work other
+# than as specifically authorized by the U.S. Government may violate any copyrights that exist in
+# this work.
+###################################################################################################
+
+import struct
+
+import numpy as np
+
+from tesse.msgs import DataResponse
+
+
+def _encode_image(img, cam_id, img_type):
+  # images are sent bottom row first, behind a 32 byte header
+  height, width = img.shape[:2]
+  data = np.flip(img, 0).astype(np.uint8).tobytes()
+  header = struct.pack("IIIII4s8x", 0, len(data), width, height, cam_id, img_type.encode("utf-8"))
+  return header + data
+
+
+def test_decode_images():
+  rng = np.random.RandomState(0)
+  height, width = 3, 5
+  rgb = rng.randint(0, 256, (height, width, 3))
+  gray = rng.randint(0, 256, (height, width, 1))
+  rgba = rng.randint(0, 256, (height, width, 4))
+  int_rgb = rng.randint(0, 256, (height, width, 3))
+
+  payload = bytearray()
+  payload += _encode_image(rgb, 0, 'xRGB')
+  payload += _encode_image(gray, 2, 'xGRY')
+  payload += _encode_image(rgba, 3, 'xFLT')
+  payload += _encode_image(int_rgb, 5, 'xINT')
+
+  response = DataResponse(images=memoryview(payload))
+
+  assert response.cameras == [0, 2, 3, 5]
+  assert response.types == ['xRGB', 'xGRY', 'xFLT', 'xINT']
+
+  img_rgb, img_gray, img_flt, img_int = response.images
+  np.testing.assert_array_equal(img_rgb, rgb)
+  np.testing.assert_array_equal(img_gray, gray.squeeze())
+
+  expected_flt = np.dot(rgba, np.array([1.0, 1.0/255.0, 1.0/(255.0*255.0), 1.0/(255.0*255.0*255.0)])) / 255.0
+  assert img_flt.dtype == np.float32
+  assert img_flt.shape == (height, width)
+  np.testing.assert_allclose(img_flt, expected_flt, rtol=0, atol=1e-6)
+
+  expected_int = int_rgb[..., 0] + 255 * int_rgb[..., 1] + 65025 * int_rgb[..., 2]
+  assert img_int.dtype == np.uint32
+  np.testing.assert_array_equal(img_int, expected_int)
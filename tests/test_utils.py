@@ -0,0 +1,62 @@
+###################################################################################################
+# DISTRIBUTION STATEMENT A. Approved for public release. Distribution is unlimited.
+#
+# This material is based upon work supported by the Under Secretary of Defense for Research and
+# Engineering under Air Force Contract No. FA8702-15-D-0001. Any opinions, findings, conclusions
+# or recommendations expressed in this material are those of the author(s) and do not necessarily
+# reflect the views of the Under Secretary of Defense for Research and Engineering.
+#
+# (c) 2020 Massachusetts Institute of Technology.
+#
+# MIT Proprietary, Subject to FAR52.227-11 Patent Rights - Ownership by the contractor (May 2014)
+#
+# The software/firmware is provided to you on an As-Is basis
+#
+# Delivered to the U.S. Government with Unlimited Rights, as defined in DFARS Part 252.227-7013
+# or 7014 (Feb 2014). Notwithstanding any copyright notice, U.S. Government rights in this work
+# are defined by DFARS 252.227-7013 or DFARS 252.227-7014 as detailed above. Use of this work other
+# than as specifically authorized by the U.S. Government may violate any copyrights that exist in
+# this work.
+###################################################################################################
+
+import defusedxml
+import defusedxml.ElementTree
+import pytest
+
+from tesse import utils
+
+
+METADATA = (b'<TESSE_Agent_Metadata_v0.5>'
+            b'<position x="1.1" y="2.2" z="3.3"/>'
+            b'<quaternion x="0.1" y="0.2" z="0.3" w="0.9"/>'
+            b'<velocity x_dot="1" y_dot="2" z_dot="3"/>'
+            b'<angular_velocity x_ang_dot="1" y_ang_dot="2" z_ang_dot="3"/>'
+            b'<acceleration x_ddot="1" y_ddot="2" z_ddot="3"/>'
+            b'<angular_acceleration x_ang_ddot="1" y_ang_ddot="2" z_ang_ddot="3"/>'
+            b'<time>12.345</time>'
+            b'<collision status="false"/>'
+            b'</TESSE_Agent_Metadata_v0.5>')
+
+ENTITY_METADATA = b'<?xml version="1.0"?><!DOCTYPE m [<!ENTITY t "1.5">]><m><time>&t;</time></m>'
+
+
+@pytest.fixture
+def defusedxml_backend(monkeypatch):
+  monkeypatch.setattr(utils, 'ET', defusedxml.ElementTree)
+  monkeypatch.setattr(utils, '_HAS_LXML', False)
+
+
+def test_xml_fromstring_lxml():
+  pytest.importorskip('lxml')
+  assert utils._HAS_LXML
+  fromstring = utils._xml_fromstring()
+  assert float(fromstring(METADATA).find('time').text) == 12.345
+  # entities are left unexpanded rather than resolved
+  assert fromstring(ENTITY_METADATA).find('time').text is None
+
+
+def test_xml_fromstring_defusedxml(defusedxml_backend):
+  fromstring = utils._xml_fromstring()
+  assert float(fromstring(METADATA).find('time').text) == 12.345
+  with pytest.raises(defusedxml.EntitiesForbidden):
+    fromstring(ENTITY_METADATA)